@@ -1,14 +1,29 @@
+import asyncio
+import functools
 import json
+import logging
 import os
 import random
 import re
-from datetime import datetime
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from zoneinfo import ZoneInfo
 
 import aiohttp
 import anthropic
 import discord
-import pytz
-from bs4 import BeautifulSoup
+import httpx
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    # Fall back to BeautifulSoup if the C parser isn't available
+    HTMLParser = None
+    from bs4 import BeautifulSoup
+
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from dotenv import load_dotenv
@@ -16,6 +31,21 @@ from dotenv import load_dotenv
 # URL regex pattern
 URL_PATTERN = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
 
+# One pass over the message instead of a substring scan per keyword.
+# Word-boundary anchors avoid firing on words that merely contain a
+# keyword (e.g. a URL slug with "summary" mid-token).
+SUMMARIZE_RE = re.compile(
+    r"\b(?:summariz\w*|summary|tl;?dr|sum up|what does this say|what'?s this about)\b",
+    re.IGNORECASE,
+)
+
+
+# Logging instead of print: lazy %-formatting only renders messages
+# that will actually be emitted, and handlers can be redirected/buffered
+# without touching call sites
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+log = logging.getLogger("bot")
+
 
 load_dotenv()
 
@@ -24,13 +54,33 @@ CHANNEL_ID = os.getenv("CHANNEL_ID")
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
 ATTIO_API_KEY = os.getenv("ATTIO_API_KEY")
 
-# Initialize Anthropic client
-claude_client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY) if ANTHROPIC_API_KEY else None
+# Initialize Anthropic client (async so Claude calls don't block the
+# event loop). One module-level instance so the underlying connection
+# pool is shared across all call sites. The explicit httpx client
+# bounds the pool and timeouts - a hung call can't hold a connection
+# forever - and HTTP/2 lets concurrent quote/summary/chat calls
+# multiplex over a single TLS connection.
+if ANTHROPIC_API_KEY:
+    claude_client = anthropic.AsyncAnthropic(
+        api_key=ANTHROPIC_API_KEY,
+        max_retries=2,
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=16,
+                max_keepalive_connections=8,
+                keepalive_expiry=30,
+            ),
+            timeout=httpx.Timeout(connect=5.0, read=60.0, write=10.0, pool=5.0),
+            http2=True,
+        ),
+    )
+else:
+    claude_client = None
 
 # Define deadlines: (name, date)
 DEADLINES = [
-    ("Metabit Contract", datetime(2026, 3, 10)),
-    ("Pear Demo Day", datetime(2026, 4, 2)),
+    ("Metabit Contract", date(2026, 3, 10)),
+    ("Pear Demo Day", date(2026, 4, 2)),
 ]
 
 # Fallback quotes in case API fails
@@ -40,13 +90,126 @@ FALLBACK_QUOTES = [
     "Chase the vision, not the money; the money will end up following you. – Tony Hsieh",
 ]
 
-# Timezone for scheduling (Eastern Time)
-ET = pytz.timezone("America/New_York")
+# Timezone for scheduling (Eastern Time). stdlib zoneinfo reads the OS
+# tzdata instead of loading pytz's bundled database at import.
+ET_NAME = "America/New_York"
+ET = ZoneInfo(ET_NAME)
+
+# Regex matching mentions of this bot in both <@id> and <@!id> forms;
+# compiled once in on_ready when the bot's user id is known
+MENTION_RE: re.Pattern | None = None
+
+
+def strip_mention(content: str) -> str:
+    """Remove mentions of the bot from message content."""
+    if MENTION_RE is None:
+        return content.strip()
+    return MENTION_RE.sub("", content).strip()
+
+
+# Small fixed pool for CPU-bound work (HTML parsing) offloaded via
+# run_in_executor; created once so reconnects don't spawn new threads
+PARSE_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+# Shared HTTP session (created lazily, reused for connection pooling)
+HTTP_SESSION: aiohttp.ClientSession | None = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Return the shared HTTP session, creating it on first use.
+
+    Lazy construction binds the session to whatever loop is running, so
+    callers don't depend on startup ordering (scheduler jobs can fire
+    before on_ready finishes).
+    """
+    global HTTP_SESSION
+    if HTTP_SESSION is None or HTTP_SESSION.closed:
+        HTTP_SESSION = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=15),
+            connector=aiohttp.TCPConnector(limit=32, limit_per_host=8, ttl_dns_cache=300),
+        )
+    return HTTP_SESSION
+
+# Rolling per-channel message buffer, newest first. Populated as
+# messages arrive so mentions can build conversation context without a
+# Discord REST fetch. Entries are (author_name, content, message_id,
+# created_at) tuples.
+CHANNEL_HISTORY: dict[int, deque] = defaultdict(lambda: deque(maxlen=50))
+
+# TTL caches for repeat Claude requests. The quote is keyed by day and
+# article summaries by URL; both repeat verbatim, so an exact-key cache
+# catches the same hits a semantic cache would without extra
+# infrastructure. Entries are (timestamp, response) tuples.
+QUOTE_CACHE_TTL = 12 * 3600  # quotes go stale after half a day
+SUMMARY_CACHE_TTL = 7 * 24 * 3600  # article content rarely changes
+_quote_cache: dict[str, tuple[float, str]] = {}
+_summary_cache: dict[str, tuple[float, str]] = {}
+
+# Per-URL locks so two concurrent "tldr" requests for the same link
+# share one fetch+summarize instead of racing past the cache check
+_summary_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+def normalize_url(url: str) -> str:
+    """Canonicalize a URL for cache lookups.
+
+    Lowercases the scheme and host and drops utm_* tracking params and
+    the fragment, so trivially different copies of the same link share
+    one cache entry.
+    """
+    try:
+        parts = urlsplit(url)
+        query = urlencode([
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith("utm_")
+        ])
+        return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
+    except ValueError:
+        return url
+
+
+def _cache_get(cache: dict, key, ttl: float):
+    """Return a cached value if present and younger than ttl seconds."""
+    entry = cache.get(key)
+    if entry and time.monotonic() - entry[0] < ttl:
+        return entry[1]
+    return None
+
+
+def _cache_put(cache: dict, key, value, maxsize: int = 256):
+    """Store a value, evicting the oldest entry if the cache is full."""
+    if len(cache) >= maxsize:
+        oldest = min(cache, key=lambda k: cache[k][0])
+        del cache[oldest]
+    cache[key] = (time.monotonic(), value)
+
 
 # Discord client setup
 intents = discord.Intents.default()
 intents.message_content = True  # Required to read message content
-client = discord.Client(intents=intents)
+
+
+class BotClient(discord.Client):
+    async def close(self):
+        global HTTP_SESSION
+        if HTTP_SESSION is not None:
+            await HTTP_SESSION.close()
+            HTTP_SESSION = None
+        if claude_client is not None:
+            await claude_client.close()
+        await super().close()
+
+
+# The bot only needs message content and display names, so skip member
+# list chunking and member caching at startup, and drop discord.py's
+# internal message cache in favor of our own rolling buffer
+client = BotClient(
+    intents=intents,
+    chunk_guilds_at_startup=False,
+    member_cache_flags=discord.MemberCacheFlags.none(),
+    max_messages=None,
+)
 
 scheduler = AsyncIOScheduler()
 
@@ -65,8 +228,15 @@ async def generate_business_quote() -> str:
     topic = random.choice(topics)
     today = datetime.now().strftime("%A, %B %d")
 
+    # One quote per day - the scheduled reminder and any same-day
+    # renders share a single Claude call
+    day_key = datetime.now().date().isoformat()
+    cached = _cache_get(_quote_cache, day_key, QUOTE_CACHE_TTL)
+    if cached:
+        return cached
+
     try:
-        response = claude_client.messages.create(
+        response = await claude_client.messages.create(
             model="claude-opus-4-6",
             max_tokens=150,
             messages=[{
@@ -74,81 +244,214 @@ async def generate_business_quote() -> str:
                 "content": f"Today is {today}. Generate a single inspiring quote about {topic} from a famous entrepreneur or business leader (with attribution). Pick someone unexpected — avoid the most overused quotes. Keep it to 1-2 sentences. Return ONLY the quote, nothing else."
             }],
         )
-        return response.content[0].text.strip()
-    except Exception as e:
-        print(f"Error generating quote: {e}")
+        quote = response.content[0].text.strip()
+        _cache_put(_quote_cache, day_key, quote)
+        return quote
+    except Exception:
+        log.exception("Error generating quote")
         return random.choice(FALLBACK_QUOTES)
 
 
+def extract_article_text(html: str) -> str | None:
+    """Pull the main article text out of an HTML page, capped at ~8000 chars."""
+    if HTMLParser is None:
+        # BeautifulSoup fallback (selectolax not installed)
+        soup = BeautifulSoup(html, "html.parser")
+        for element in soup.select("script, style, nav, header, footer, aside"):
+            element.decompose()
+        article = soup.find("article") or soup.find("main") or soup.find("body")
+        if not article:
+            return None
+        text = article.get_text(separator="\n", strip=True)
+        if len(text) > 8000:
+            text = text[:8000] + "..."
+        return text
+
+    # selectolax's C parser is an order of magnitude faster than bs4
+    # for this extract-text-and-discard workload
+    tree = HTMLParser(html)
+
+    # Remove script, style, and page-chrome elements in one traversal
+    for element in tree.css("script, style, nav, header, footer, aside"):
+        element.decompose()
+
+    # Try to find the main article content
+    article = tree.css_first("article") or tree.css_first("main") or tree.body
+    if not article:
+        return None
+
+    # Accumulate text node by node and stop once we hit the ~8000
+    # char cap, instead of materializing the full page text and then
+    # slicing it (the full text can be hundreds of KB)
+    parts = []
+    total = 0
+    truncated = False
+    for node in article.traverse(include_text=True):
+        if node.tag != "-text":
+            continue
+        chunk = (node.text_content or "").strip()
+        if not chunk:
+            continue
+        parts.append(chunk)
+        total += len(chunk) + 1
+        if total >= 8000:
+            truncated = True
+            break
+
+    if not parts:
+        return None
+
+    text = "\n".join(parts)
+    if truncated or len(text) > 8000:
+        text = text[:8000] + "..."
+
+    return text
+
+
 async def fetch_article_content(url: str) -> str | None:
     """Fetch and extract text content from a URL."""
     try:
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as response:
-                if response.status != 200:
-                    return None
-                html = await response.text()
+        session = get_http_session()
+        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as response:
+            if response.status != 200:
+                return None
+
+            # Bail early on non-HTML responses (PDFs, images, binaries)
+            content_type = response.headers.get("Content-Type", "")
+            if content_type and "html" not in content_type:
+                return None
+
+            # Stream the body and stop at 128KB - plenty of HTML to
+            # yield 8000 chars of text, and it bounds bandwidth and
+            # memory on huge pages
+            buf = bytearray()
+            async for chunk in response.content.iter_chunked(16384):
+                buf.extend(chunk)
+                if len(buf) > 128 * 1024:
+                    break
+            # response.charset is header-only; get_encoding() raises on
+            # a streamed (unread) body when the header has no charset
+            html = buf.decode(response.charset or "utf-8", errors="replace")
+
+        # Parsing is CPU-bound; run it on a worker thread so heartbeats
+        # and other coroutines keep progressing
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(PARSE_EXECUTOR, extract_article_text, html)
+    except Exception:
+        log.exception("Error fetching article %s", url)
+        return None
 
-        soup = BeautifulSoup(html, "html.parser")
 
-        # Remove script and style elements
-        for element in soup(["script", "style", "nav", "header", "footer", "aside"]):
-            element.decompose()
+async def send_chunked(channel, text: str) -> None:
+    """Send text to a channel, split into Discord-sized messages.
 
-        # Try to find the main article content
-        article = soup.find("article") or soup.find("main") or soup.find("body")
-        if not article:
-            return None
+    The first chunk goes out on its own so the start arrives in order;
+    the rest are fired concurrently.
+    """
+    if len(text) <= 2000:
+        await channel.send(text)
+        return
+    chunks = [text[i : i + 2000] for i in range(0, len(text), 2000)]
+    await channel.send(chunks[0])
+    await asyncio.gather(*(channel.send(chunk) for chunk in chunks[1:]))
 
-        # Get text and clean it up
-        text = article.get_text(separator="\n", strip=True)
 
-        # Limit to first ~8000 chars to avoid token limits
-        if len(text) > 8000:
-            text = text[:8000] + "..."
+async def summarize_article(url: str, channel) -> None:
+    """Fetch an article, summarize it with Claude, and send the summary.
 
-        return text
-    except Exception as e:
-        print(f"Error fetching article: {e}")
-        return None
+    Streams the summary into the channel as it generates, so long
+    summaries start appearing before the Claude call finishes.
+    """
+    if not claude_client:
+        await channel.send("Sorry, I can't summarize articles without an Anthropic API key configured.")
+        return
 
+    # Same link is often shared/asked about more than once in a
+    # channel; the per-URL lock means concurrent requests for one link
+    # wait for (and reuse) the first fetch instead of duplicating it
+    norm = normalize_url(url)
+    async with _summary_locks[norm]:
+        cached = _cache_get(_summary_cache, norm, SUMMARY_CACHE_TTL)
+        if cached:
+            await send_chunked(channel, cached)
+            return
+        await _summarize_article_uncached(url, norm, channel)
 
-async def summarize_article(url: str) -> str:
-    """Fetch an article and summarize it using Claude."""
-    if not claude_client:
-        return "Sorry, I can't summarize articles without an Anthropic API key configured."
 
+async def _summarize_article_uncached(url: str, norm: str, channel) -> None:
+    """Fetch, summarize, cache, and send an article (cache miss path)."""
     content = await fetch_article_content(url)
     if not content:
-        return f"Sorry, I couldn't fetch the content from that URL. It might be paywalled, require login, or block bots."
+        await channel.send("Sorry, I couldn't fetch the content from that URL. It might be paywalled, require login, or block bots.")
+        return
 
     try:
-        response = claude_client.messages.create(
+        collected = []
+        buffer = ""
+        async with claude_client.messages.stream(
             model="claude-opus-4-6",
             max_tokens=1024,
             messages=[{
                 "role": "user",
-                "content": f"""Please summarize this article concisely. Include:
+                # Cache breakpoint on the article text so follow-up
+                # requests about the same article reuse the cached prefix
+                "content": [{
+                    "type": "text",
+                    "text": f"""Please summarize this article concisely. Include:
 - The main topic/thesis
 - Key points (3-5 bullet points)
 - Any important conclusions or takeaways
 
 Article content:
-{content}"""
+{content}""",
+                    "cache_control": {"type": "ephemeral"},
+                }],
             }],
-        )
-        return response.content[0].text
-    except Exception as e:
-        print(f"Error summarizing article: {e}")
-        return "Sorry, I encountered an error trying to summarize the article."
+        ) as stream:
+            async for text in stream.text_stream:
+                collected.append(text)
+                buffer += text
+                # Flush full Discord messages while tokens still arrive
+                while len(buffer) > 1900:
+                    chunk, buffer = split_at_sentence(buffer)
+                    await channel.send(chunk)
+
+        if buffer:
+            await channel.send(buffer)
+
+        summary = "".join(collected)
+        if summary:
+            _cache_put(_summary_cache, norm, summary)
+    except Exception:
+        log.exception("Error summarizing article %s", url)
+        await channel.send("Sorry, I encountered an error trying to summarize the article.")
+
+
+def split_at_sentence(text: str, limit: int = 1900) -> tuple[str, str]:
+    """Split text near limit, preferring a line or sentence boundary."""
+    if len(text) <= limit:
+        return text, ""
+    cut = limit
+    for sep in ("\n", ". "):
+        idx = text.rfind(sep, 0, limit)
+        if idx > 0:
+            cut = idx + len(sep)
+            break
+    return text[:cut], text[cut:]
 
 
 def extract_urls(text: str) -> list[str]:
     """Extract URLs from text."""
-    return URL_PATTERN.findall(text)
+    # Most messages have no URL; a plain substring scan settles that
+    # without the regex engine, and on a hit the regex starts at the
+    # first candidate instead of rescanning the prefix
+    start = text.find("http")
+    if start == -1:
+        return []
+    return URL_PATTERN.findall(text, start)
 
 
 # Attio API base URL
@@ -219,39 +522,64 @@ ATTIO_TOOLS = [
             "type": "object",
             "properties": {},
             "required": []
-        }
+        },
+        # Cache breakpoint on the last tool so the whole tool block is
+        # served from Anthropic's prompt cache on subsequent calls
+        "cache_control": {"type": "ephemeral"}
     }
 ]
 
 
+# Short-TTL cache for read-only Attio requests. Pipeline data changes
+# slowly relative to a conversation, and Claude often issues the same
+# query several times within one tool-use loop.
+ATTIO_CACHE_TTL = 60
+_attio_cache: dict[tuple, tuple[float, dict]] = {}
+
+
+def _attio_is_read_only(endpoint: str, method: str) -> bool:
+    """Only plain GETs and record queries are safe to cache."""
+    return method == "GET" or endpoint.endswith("/query")
+
+
 async def attio_request(endpoint: str, method: str = "GET", json_data: dict = None) -> dict | None:
     """Make an authenticated request to the Attio API."""
     if not ATTIO_API_KEY:
         return {"error": "Attio API key not configured"}
 
+    cacheable = _attio_is_read_only(endpoint, method)
+    cache_key = (endpoint, method, json.dumps(json_data, sort_keys=True) if json_data else None)
+    if cacheable:
+        cached = _cache_get(_attio_cache, cache_key, ATTIO_CACHE_TTL)
+        if cached is not None:
+            return cached
+
     headers = {
         "Authorization": f"Bearer {ATTIO_API_KEY}",
         "Content-Type": "application/json"
     }
 
     try:
-        async with aiohttp.ClientSession() as session:
-            url = f"{ATTIO_API_BASE}{endpoint}"
-            async with session.request(
-                method,
-                url,
-                headers=headers,
-                json=json_data,
-                timeout=aiohttp.ClientTimeout(total=15)
-            ) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    error_text = await response.text()
-                    print(f"Attio API error {response.status}: {error_text}")
-                    return {"error": f"API returned status {response.status}"}
+        url = f"{ATTIO_API_BASE}{endpoint}"
+        session = get_http_session()
+        async with session.request(
+            method,
+            url,
+            headers=headers,
+            json=json_data,
+            timeout=aiohttp.ClientTimeout(total=15)
+        ) as response:
+            if response.status == 200:
+                result = await response.json()
+                if cacheable:
+                    _cache_put(_attio_cache, cache_key, result)
+                return result
+            else:
+                error_text = await response.text()
+                log.error("Attio API error %s: %s", response.status, error_text)
+                return {"error": f"API returned status {response.status}"}
     except Exception as e:
-        print(f"Attio request error: {e}")
+        log.exception("Attio request error")
         return {"error": str(e)}
 
 
@@ -271,15 +599,14 @@ async def attio_list_deals(limit: int = 20, stage: str = None) -> dict:
 
 
 async def attio_get_deal(deal_id: str) -> dict:
-    """Get a specific deal by ID using query filter."""
-    result = await attio_request(
-        "/objects/deals/records/query",
-        method="POST",
-        json_data={
-            "filter": {"record_id": deal_id}
-        }
-    )
-    return result or {"error": "Failed to fetch deal"}
+    """Get a specific deal by ID via Attio's direct record endpoint."""
+    result = await attio_request(f"/objects/deals/records/{deal_id}")
+    if not result or "error" in result:
+        return result or {"error": "Failed to fetch deal"}
+
+    # The direct endpoint returns a single record; wrap it in a list so
+    # the tool JSON keeps the same shape as the query-based tools
+    return {"data": [result.get("data", result)]}
 
 
 async def attio_search_deals(query: str) -> dict:
@@ -294,14 +621,27 @@ async def attio_search_deals(query: str) -> dict:
     return result or {"error": "Search failed"}
 
 
-async def attio_list_pipeline_stages() -> dict:
-    """Get unique pipeline stages from all deals."""
+async def _fetch_all_deals() -> dict | None:
+    """Fetch the full deal list (shared by the pipeline views below).
+
+    Both pipeline tools need the same limit-100 query; going through one
+    helper means they share a single request (and cache entry) instead
+    of issuing identical POSTs.
+    """
     result = await attio_request(
         "/objects/deals/records/query",
         method="POST",
         json_data={"limit": 100}
     )
     if not result or "data" not in result:
+        return None
+    return result
+
+
+async def attio_list_pipeline_stages() -> dict:
+    """Get unique pipeline stages from all deals."""
+    result = await _fetch_all_deals()
+    if result is None:
         return {"error": "Failed to fetch pipeline info"}
 
     # Extract unique stages
@@ -320,16 +660,12 @@ async def attio_list_pipeline_stages() -> dict:
 
 async def attio_get_pipeline_summary() -> dict:
     """Get a summary of the pipeline with counts and values by stage."""
-    result = await attio_request(
-        "/objects/deals/records/query",
-        method="POST",
-        json_data={"limit": 100}
-    )
-    if not result or "data" not in result:
+    result = await _fetch_all_deals()
+    if result is None:
         return {"error": "Failed to fetch pipeline data"}
 
     # Aggregate by stage
-    summary = {}
+    summary = defaultdict(lambda: {"count": 0, "total_value": 0, "deals": []})
     for deal in result.get("data", []):
         stage_data = deal.get("values", {}).get("stage", [])
         stage_title = "Unknown"
@@ -339,15 +675,12 @@ async def attio_get_pipeline_summary() -> dict:
         value_data = deal.get("values", {}).get("value", [])
         deal_value = value_data[0].get("currency_value", 0) if value_data else 0
 
-        if stage_title not in summary:
-            summary[stage_title] = {"count": 0, "total_value": 0, "deals": []}
-
         deal_name = deal.get("values", {}).get("name", [{}])[0].get("value", "Unknown")
         summary[stage_title]["count"] += 1
         summary[stage_title]["total_value"] += deal_value
         summary[stage_title]["deals"].append({"name": deal_name, "value": deal_value})
 
-    return {"pipeline_summary": summary}
+    return {"pipeline_summary": dict(summary)}
 
 
 async def execute_attio_tool(tool_name: str, tool_input: dict) -> str:
@@ -371,14 +704,42 @@ async def execute_attio_tool(tool_name: str, tool_input: dict) -> str:
     return json.dumps(result, indent=2, default=str)
 
 
-async def get_countdown_message() -> str:
-    """Generate the countdown message for all deadlines."""
-    today = datetime.now().date()
+# Local state so restarts can tell whether today's reminder already
+# went out without scanning channel history
+STATE_DIR = ".state"
+LAST_REMINDER_FILE = os.path.join(STATE_DIR, "last_reminder.txt")
+
+
+def read_last_reminder_date() -> str | None:
+    """Read the ISO date of the last sent reminder, or None if unknown."""
+    try:
+        with open(LAST_REMINDER_FILE) as f:
+            return f.read().strip()
+    except OSError:
+        return None
 
+
+def write_last_reminder_date(day) -> None:
+    """Record that the reminder was sent on the given date."""
+    try:
+        os.makedirs(STATE_DIR, exist_ok=True)
+        with open(LAST_REMINDER_FILE, "w") as f:
+            f.write(day.isoformat())
+    except OSError as e:
+        log.error("Error writing reminder state: %s", e)
+
+
+@functools.lru_cache(maxsize=1)
+def render_countdown(today: date) -> str:
+    """Render the deadline lines for a given day (quote excluded).
+
+    Cached so the scheduled send and any on-demand renders on the same
+    day share one computation.
+    """
     lines = ["Hey Gents, here's the deadline:\n"]
 
     for name, deadline_date in DEADLINES:
-        days_remaining = (deadline_date.date() - today).days
+        days_remaining = (deadline_date - today).days
 
         if days_remaining > 0:
             lines.append(f"{name}: {days_remaining} days remaining")
@@ -387,27 +748,36 @@ async def get_countdown_message() -> str:
         else:
             lines.append(f"{name}: Deadline passed!")
 
-    # Generate a quote using Claude
-    quote = await generate_business_quote()
-    lines.append(f"\n{quote}")
-
     return "\n".join(lines)
 
 
+async def get_countdown_message() -> str:
+    """Generate the countdown message for all deadlines."""
+    # Kick off the quote (the slow Claude round-trip) first so it runs
+    # while the deadline lines are rendered
+    quote_task = asyncio.create_task(generate_business_quote())
+
+    countdown = render_countdown(datetime.now().date())
+
+    quote = await quote_task
+    return f"{countdown}\n\n{quote}"
+
+
 async def send_daily_reminder():
     """Send the daily countdown reminder to the configured channel."""
     if not CHANNEL_ID:
-        print("Error: CHANNEL_ID not configured")
+        log.error("CHANNEL_ID not configured")
         return
 
     channel = client.get_channel(int(CHANNEL_ID))
     if channel is None:
-        print(f"Error: Could not find channel with ID {CHANNEL_ID}")
+        log.error("Could not find channel with ID %s", CHANNEL_ID)
         return
 
     message = await get_countdown_message()
     await channel.send(message)
-    print(f"Sent daily reminder at {datetime.now(ET)}")
+    write_last_reminder_date(datetime.now(ET).date())
+    log.info("Sent daily reminder at %s", datetime.now(ET))
 
 
 async def check_and_send_missed_reminder():
@@ -421,12 +791,24 @@ async def check_and_send_missed_reminder():
 
     # Only check if it's past the reminder time
     if now.hour < reminder_hour:
-        print(f"It's before {reminder_hour}:00 AM ET, no need to check for missed reminder")
+        log.info("It's before %s:00 AM ET, no need to check for missed reminder", reminder_hour)
+        return
+
+    # Fast path: the state file tells us whether today's reminder went
+    # out without any Discord API calls
+    last_sent = read_last_reminder_date()
+    if last_sent == today.isoformat():
+        log.info("Today's reminder was already sent (per state file)")
+        return
+    if last_sent is not None:
+        log.info("Missed reminder detected (last sent %s)! Sending now at %s", last_sent, now)
+        await send_daily_reminder()
         return
 
+    # No state file yet (first run) - fall back to scanning history
     channel = client.get_channel(int(CHANNEL_ID))
     if channel is None:
-        print(f"Error: Could not find channel with ID {CHANNEL_ID}")
+        log.error("Could not find channel with ID %s", CHANNEL_ID)
         return
 
     # Check recent messages to see if we already sent today's reminder
@@ -437,26 +819,38 @@ async def check_and_send_missed_reminder():
                 # Check if message was sent today and contains the reminder format
                 msg_date = msg.created_at.astimezone(ET).date()
                 if msg_date == today and "Hey Gents, here's the deadline:" in msg.content:
-                    print(f"Today's reminder was already sent at {msg.created_at}")
+                    log.info("Today's reminder was already sent at %s", msg.created_at)
                     return
 
         # If we get here, no reminder was sent today - send it now
-        print(f"Missed reminder detected! Sending now at {now}")
+        log.info("Missed reminder detected! Sending now at %s", now)
         await send_daily_reminder()
 
-    except Exception as e:
-        print(f"Error checking for missed reminder: {e}")
+    except Exception:
+        log.exception("Error checking for missed reminder")
 
 
 @client.event
 async def on_message(message):
     """Handle incoming messages - respond when bot is mentioned."""
-    # Ignore messages from the bot itself
-    if message.author == client.user:
+    # Record every message (including our own) in the rolling buffer so
+    # later mentions have context without re-fetching channel history
+    CHANNEL_HISTORY[message.channel.id].appendleft(
+        (message.author.display_name, message.content, message.id, message.created_at)
+    )
+
+    # Ignore messages from bots (including ourselves) - also avoids
+    # bot-to-bot reply loops
+    if message.author.bot:
         return
 
-    # Check if the bot is mentioned
-    if client.user not in message.mentions:
+    # Check if the bot is mentioned. raw_mentions (plain ids parsed
+    # from the content) is the cheap common case; the mentions list
+    # still has to be consulted because it additionally carries the
+    # replied-to user when someone replies to one of our messages
+    if client.user.id not in message.raw_mentions and all(
+        user.id != client.user.id for user in message.mentions
+    ):
         return
 
     # Check if Anthropic client is configured
@@ -465,11 +859,10 @@ async def on_message(message):
         return
 
     # Get the user's message (remove the bot mention)
-    user_message = message.content.replace(f"<@{client.user.id}>", "").strip().lower()
+    user_message = strip_mention(message.content)
 
     # Check if user wants to summarize an article
-    summarize_keywords = ["summarize", "summary", "tldr", "tl;dr", "sum up", "what does this say", "what's this about"]
-    wants_summary = any(keyword in user_message for keyword in summarize_keywords)
+    wants_summary = SUMMARIZE_RE.search(user_message) is not None
 
     if wants_summary:
         # Show typing indicator while processing
@@ -485,51 +878,70 @@ async def on_message(message):
                 except:
                     pass
 
-            # If still no URLs, check recent messages for URLs
+            # If still no URLs, check recent messages for URLs - from
+            # the rolling buffer first, so steady-state lookups cost no
+            # Discord REST call
             if not urls:
-                async for msg in message.channel.history(limit=10):
-                    if msg.id != message.id:
-                        found_urls = extract_urls(msg.content)
+                buffered = CHANNEL_HISTORY[message.channel.id]
+                for _author_name, content, msg_id, _created_at in buffered:
+                    if msg_id != message.id:
+                        found_urls = extract_urls(content)
                         if found_urls:
                             urls = found_urls
                             break
 
+                # Cold start: the buffer holds nothing but the
+                # triggering message, so fall back to one bulk fetch
+                # and scan it in memory
+                if not urls and len(buffered) <= 1:
+                    recent = [msg async for msg in message.channel.history(limit=10)]
+                    for msg in recent:
+                        if msg.id != message.id:
+                            found_urls = extract_urls(msg.content)
+                            if found_urls:
+                                urls = found_urls
+                                break
+
             if not urls:
                 await message.reply("I couldn't find any URLs to summarize. Share a link or reply to a message with a link!")
                 return
 
-            # Summarize the first URL found
+            # Summarize the first URL found; the summary streams into
+            # the channel as it generates
             url = urls[0]
             await message.reply(f"Let me read that article for you...")
-            summary = await summarize_article(url)
-
-            # Send the summary (split if too long for Discord)
-            if len(summary) <= 2000:
-                await message.channel.send(summary)
-            else:
-                for i in range(0, len(summary), 2000):
-                    await message.channel.send(summary[i : i + 2000])
+            await summarize_article(url, message.channel)
         return
 
     # Regular chat response
     async with message.channel.typing():
-        # Fetch recent messages for context (last 25 messages)
-        history = []
-        async for msg in message.channel.history(limit=25):
-            # Build context from recent messages
-            author_name = msg.author.display_name
-            content = msg.content
-            # Remove bot mention from the current message for cleaner context
-            if msg.id == message.id:
-                content = content.replace(f"<@{client.user.id}>", "").strip()
-            history.append(f"{author_name}: {content}")
-
-        # Reverse to chronological order
-        history.reverse()
-        conversation_context = "\n".join(history)
+        # Build context from the rolling buffer (last 25 messages,
+        # newest first); fall back to a REST fetch only on a cold
+        # start, when the buffer holds nothing but the triggering
+        # message. Awaits run between the appendleft and this read, so
+        # the triggering message may no longer be the head of the
+        # deque; exclude it by id and append it outside the loop with
+        # its mention stripped once.
+        buffered = list(CHANNEL_HISTORY[message.channel.id])[:25]
+        if len(buffered) > 1:
+            history = [
+                f"{author_name}: {content}"
+                for author_name, content, msg_id, _created_at in buffered
+                if msg_id != message.id
+            ]
+        else:
+            history = [
+                f"{msg.author.display_name}: {msg.content}"
+                async for msg in message.channel.history(limit=25)
+                if msg.id != message.id
+            ]
+
+        # Join in chronological order, current message last
+        current_line = f"{message.author.display_name}: {strip_mention(message.content)}"
+        conversation_context = "\n".join([*reversed(history), current_line])
 
         # Get the user's question (remove the bot mention)
-        user_question = message.content.replace(f"<@{client.user.id}>", "").strip()
+        user_question = strip_mention(message.content)
 
         # Build the prompt for Claude
         system_prompt = """You are a helpful assistant in a Discord server. You have access to recent conversation history for context.
@@ -542,6 +954,14 @@ You can also summarize articles if someone shares a URL and asks you to summariz
 
 You have access to Attio CRM tools to look up deals, search for companies/contacts, and check the sales pipeline. Use these tools when users ask about deals, pipeline, CRM data, sales, prospects, or specific companies/contacts."""
 
+        # Structured system block with a cache breakpoint so repeated
+        # calls (and tool-loop round-trips) reuse the cached prefix
+        system_blocks = [{
+            "type": "text",
+            "text": system_prompt,
+            "cache_control": {"type": "ephemeral"},
+        }]
+
         user_prompt = f"""Here's the recent conversation in this channel:
 
 {conversation_context}
@@ -554,85 +974,122 @@ Please respond helpfully and concisely."""
             # Determine if we should include Attio tools
             tools = ATTIO_TOOLS if ATTIO_API_KEY else None
 
-            # Call Claude API with tools if available
-            response = claude_client.messages.create(
-                model="claude-opus-4-6",
-                max_tokens=1024,
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_prompt}],
-                tools=tools,
-            )
-
-            # Handle tool use responses
-            messages = [{"role": "user", "content": user_prompt}]
-            while response.stop_reason == "tool_use":
-                # Extract tool calls from response
-                tool_results = []
-                assistant_content = response.content
-
-                for block in response.content:
-                    if block.type == "tool_use":
-                        print(f"Executing Attio tool: {block.name}")
-                        result = await execute_attio_tool(block.name, block.input)
-                        tool_results.append({
-                            "type": "tool_result",
-                            "tool_use_id": block.id,
-                            "content": result
-                        })
-
-                # Add assistant response and tool results to messages
-                messages.append({"role": "assistant", "content": assistant_content})
-                messages.append({"role": "user", "content": tool_results})
-
-                # Get next response from Claude
-                response = claude_client.messages.create(
+            # Stream Claude's response so long replies start appearing on
+            # Discord before generation finishes. Tool rounds rarely emit
+            # enough text to flush, so in practice only the final answer
+            # streams out.
+            # Cache breakpoint on the user prompt so tool-loop
+            # round-trips reuse the conversation prefix, not just the
+            # system prompt and tool schemas
+            messages = [{
+                "role": "user",
+                "content": [{
+                    "type": "text",
+                    "text": user_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }],
+            }]
+            sent_any = False
+            cached_tail = None
+
+            while True:
+                buffer = ""
+                async with claude_client.messages.stream(
                     model="claude-opus-4-6",
                     max_tokens=1024,
-                    system=system_prompt,
+                    system=system_blocks,
                     messages=messages,
                     tools=tools,
+                ) as stream:
+                    async for text in stream.text_stream:
+                        buffer += text
+                        # Flush full Discord messages while tokens are
+                        # still arriving
+                        while len(buffer) > 1900:
+                            chunk, buffer = split_at_sentence(buffer)
+                            if sent_any:
+                                await message.channel.send(chunk)
+                            else:
+                                await message.reply(chunk)
+                                sent_any = True
+                    response = await stream.get_final_message()
+
+                if response.stop_reason != "tool_use":
+                    break
+
+                # If this tool round already flushed partial prose,
+                # send the tail too rather than cutting off
+                # mid-sentence; rounds that never hit the flush
+                # threshold still discard their preamble, matching the
+                # old non-streaming behavior
+                if sent_any and buffer:
+                    await message.channel.send(buffer)
+
+                # Execute the requested tools concurrently and loop for
+                # the next response - total latency is the slowest call
+                # instead of the sum
+                tool_blocks = [b for b in response.content if b.type == "tool_use"]
+                for block in tool_blocks:
+                    log.info("Executing Attio tool: %s", block.name)
+                results = await asyncio.gather(
+                    *(execute_attio_tool(b.name, b.input) for b in tool_blocks)
                 )
+                tool_results = [
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": block.id,
+                        "content": result
+                    }
+                    for block, result in zip(tool_blocks, results)
+                ]
+
+                # Move the tail cache breakpoint to the newest tool
+                # result each round, staying within the API's
+                # four-breakpoint limit while caching the whole prefix
+                if tool_results:
+                    if cached_tail is not None:
+                        cached_tail.pop("cache_control", None)
+                    tool_results[-1]["cache_control"] = {"type": "ephemeral"}
+                    cached_tail = tool_results[-1]
+
+                messages.append({"role": "assistant", "content": response.content})
+                messages.append({"role": "user", "content": tool_results})
 
-            # Extract text response
-            reply = ""
-            for block in response.content:
-                if hasattr(block, "text"):
-                    reply += block.text
-
-            if not reply:
-                reply = "I processed your request but couldn't generate a response."
+            # Send whatever text remains from the final response
+            if buffer:
+                if sent_any:
+                    await message.channel.send(buffer)
+                else:
+                    await message.reply(buffer)
+            elif not sent_any:
+                await message.reply("I processed your request but couldn't generate a response.")
 
-            # Send the response (split if too long for Discord)
-            if len(reply) <= 2000:
-                await message.reply(reply)
-            else:
-                # Split into chunks
-                for i in range(0, len(reply), 2000):
-                    chunk = reply[i : i + 2000]
-                    if i == 0:
-                        await message.reply(chunk)
-                    else:
-                        await message.channel.send(chunk)
-
-        except Exception as e:
-            print(f"Error calling Claude API: {e}")
+        except Exception:
+            log.exception("Error calling Claude API")
             await message.reply("Sorry, I encountered an error trying to respond. Please try again.")
 
 
 @client.event
 async def on_ready():
     """Called when the bot is ready and connected to Discord."""
-    print(f"Bot is ready! Logged in as {client.user}")
+    log.info("Bot is ready! Logged in as %s", client.user)
+
+    # Compile the mention pattern now that we know our user id; handles
+    # both the plain and nickname (<@!id>) mention forms
+    global MENTION_RE
+    MENTION_RE = re.compile(rf"<@!?{client.user.id}>")
 
     # Schedule daily reminder at 8:00 AM ET
     scheduler.add_job(
         send_daily_reminder,
-        CronTrigger(hour=8, minute=0, timezone=ET),
+        # APScheduler 3.x wants a pytz zone; passing the IANA name lets
+        # it resolve one itself without us importing pytz
+        CronTrigger(hour=8, minute=0, timezone=ET_NAME),
         id="daily_reminder",
         replace_existing=True,
     )
     scheduler.start()
-    print("Scheduler started - daily reminders at 8:00 AM ET")
+    log.info("Scheduler started - daily reminders at 8:00 AM ET")
 
     # Check if we missed today's reminder (e.g., due to restart)
     await check_and_send_missed_reminder()
@@ -640,20 +1097,20 @@ async def on_ready():
 
 if __name__ == "__main__":
     if not DISCORD_TOKEN:
-        print("Error: DISCORD_TOKEN not found in environment variables")
-        print("Please create a .env file with your Discord bot token")
+        log.error("DISCORD_TOKEN not found in environment variables")
+        log.error("Please create a .env file with your Discord bot token")
         exit(1)
 
     if not CHANNEL_ID:
-        print("Warning: CHANNEL_ID not found in environment variables")
-        print("The bot will start but won't send reminders until configured")
+        log.warning("CHANNEL_ID not found in environment variables")
+        log.warning("The bot will start but won't send reminders until configured")
 
     if not ANTHROPIC_API_KEY:
-        print("Warning: ANTHROPIC_API_KEY not found in environment variables")
-        print("The bot will start but won't respond to @mentions until configured")
+        log.warning("ANTHROPIC_API_KEY not found in environment variables")
+        log.warning("The bot will start but won't respond to @mentions until configured")
 
     if not ATTIO_API_KEY:
-        print("Warning: ATTIO_API_KEY not found in environment variables")
-        print("The bot will start but won't have CRM access until configured")
+        log.warning("ATTIO_API_KEY not found in environment variables")
+        log.warning("The bot will start but won't have CRM access until configured")
 
     client.run(DISCORD_TOKEN)